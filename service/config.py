@@ -15,6 +15,26 @@ SQLALCHEMY_DATABASE_URI = DATABASE_URI
 SQLALCHEMY_TRACK_MODIFICATIONS = False
 # SQLALCHEMY_POOL_SIZE = 2
 
+# Keep pooled connections warm between requests: pre-ping recycles dead
+# sockets instead of failing a request, and TCP keepalives stop idle
+# connections from being dropped by the network in between. LIFO
+# checkout reuses the most recently returned connection, so a small hot
+# set stays warm instead of cycling through the whole pool — this also
+# lets tests reuse one connection instead of re-handshaking per test
+SQLALCHEMY_ENGINE_OPTIONS = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_pre_ping": True,
+    "pool_use_lifo": True,
+    "pool_recycle": 3600,
+    "connect_args": {
+        "keepalives": 1,
+        "keepalives_idle": 30,
+        "keepalives_interval": 10,
+        "keepalives_count": 5,
+    },
+}
+
 # Secret for session management
 SECRET_KEY = os.getenv("SECRET_KEY", "sup3r-s3cr3t")
 LOGGING_LEVEL = logging.INFO
@@ -19,12 +19,24 @@ Model class for WishlistItems
 """
 
 import logging
+import sys
+from sqlalchemy import bindparam, lambda_stmt, select
 from .persistent_base import db, PersistentBase, DataValidationError
 
 # from .wishlists import Wishlists
 
 logger = logging.getLogger("flask.app")
 
+# Pre-interned serialization keys: building the dict via zip() against a
+# module-level tuple skips re-hashing four string literals on every
+# serialize() call in the item list hot loop
+_WI_KEYS = (
+    sys.intern("wishlist_id"),
+    sys.intern("product_id"),
+    sys.intern("description"),
+    sys.intern("position"),
+)
+
 
 class WishlistItems(db.Model, PersistentBase):
     """Class that represents an item in a Wishlist"""
@@ -38,6 +50,10 @@ class WishlistItems(db.Model, PersistentBase):
     description = db.Column(db.String(255))
     position = db.Column(db.Integer, nullable=False)
 
+    # Covers the filter-by-wishlist + order-by-position access pattern so
+    # item listing is an index scan and MAX(position) is a B-tree descent
+    __table_args__ = (db.Index("ix_wishlist_items_wid_pos", "wishlist_id", "position"),)
+
     # wishlist = db.relationship('Wishlists', backref=db.backref('wishlist_items', lazy=True))
 
     def __repr__(self):
@@ -45,57 +61,178 @@ class WishlistItems(db.Model, PersistentBase):
 
     def serialize(self) -> dict:
         """Convert a WishlistItem into a dictionary"""
-        return {
-            "wishlist_id": self.wishlist_id,
-            "product_id": self.product_id,
-            "description": self.description,
-            "position": self.position,
-        }
+        return dict(
+            zip(
+                _WI_KEYS,
+                (self.wishlist_id, self.product_id, self.description, self.position),
+            )
+        )
 
     def deserialize(self, data: dict) -> None:
-        """Convert a dictionary into a WishlistItem"""
-        # pylint: disable=duplicate-code
+        """Convert a dictionary into a WishlistItem
+
+        Uses dict.get() and explicit checks instead of KeyError-driven
+        control flow so the common present/absent cases never build an
+        exception object; the exact `type(...) is int` test also skips
+        the isinstance() MRO walk on this hot path.
+        """
+        # pylint: disable=unidiomatic-typecheck
         try:
-            if not isinstance(data["product_id"], int):
-                raise TypeError("product_id must be an integer")
+            product_id = data.get("product_id")
+            if product_id is None:
+                raise DataValidationError("Missing key: product_id")
+            if type(product_id) is not int:
+                raise DataValidationError(
+                    "Invalid type: product_id must be an integer"
+                )
             self.wishlist_id = data.get("wishlist_id")
-            self.product_id = data["product_id"]
+            self.product_id = product_id
             self.description = data.get("description")
             if self.position is None:
                 self.position = data.get("position", 0)
         except AttributeError as e:
             raise DataValidationError(f"Invalid attribute: {e.args[0]}") from e
-        except KeyError as e:
-            raise DataValidationError(f"Missing key: {e.args[0]}") from e
-        except TypeError as e:
-            raise DataValidationError(f"Invalid type: {e}") from e
         return self
 
     @classmethod
     def find_all_by_wishlist_id(cls, wishlist_id: int):
-        """Find all WishlistItems for a given wishlist ID"""
-        return (
-            cls.query.filter(cls.wishlist_id == wishlist_id)
+        """Find all WishlistItems for a given wishlist ID
+
+        The statement is wrapped in `lambda_stmt` so the SQL string is
+        compiled once and cached; subsequent calls only bind parameters.
+        """
+        stmt = lambda_stmt(
+            lambda: select(cls)
+            .where(cls.wishlist_id == bindparam("wishlist_id"))
             .order_by(cls.position.asc())
-            .all()
+        )
+        return (
+            db.session.execute(stmt, {"wishlist_id": wishlist_id}).scalars().all()
         )
 
     @classmethod
     def find_by_wishlist_and_product(cls, wishlist_id: int, product_id: int):
         """Find a WishlistItem by its wishlist ID and product ID"""
-        return cls.query.filter(
-            cls.wishlist_id == wishlist_id, cls.product_id == product_id
-        ).first()
+        stmt = lambda_stmt(
+            lambda: select(cls).where(
+                cls.wishlist_id == bindparam("wishlist_id"),
+                cls.product_id == bindparam("product_id"),
+            )
+        )
+        return (
+            db.session.execute(
+                stmt, {"wishlist_id": wishlist_id, "product_id": product_id}
+            )
+            .scalars()
+            .first()
+        )
 
     @classmethod
-    def find_last_position(cls, wishlist_id: int):
-        """Find the last position number in a given wishlist"""
-        item = (
-            cls.query.filter(cls.wishlist_id == wishlist_id)
-            .order_by(cls.position.desc())
+    def find_with_parent_check(cls, wishlist_id: int, product_id: int):
+        """Find a WishlistItem and its parent's existence in one query
+
+        Outer-joins the item onto the wishlist row so "no wishlist" and
+        "no item" can be told apart from a single result set instead of
+        two round trips. Returns a (wishlist_exists, item_or_none)
+        tuple.
+        """
+        # pylint: disable=import-outside-toplevel, cyclic-import
+        from .wishlists import Wishlists
+
+        row = (
+            db.session.query(Wishlists.id, cls)
+            .outerjoin(
+                cls,
+                db.and_(cls.wishlist_id == Wishlists.id, cls.product_id == product_id),
+            )
+            .filter(Wishlists.id == wishlist_id)
             .first()
         )
-        return item.position if item else 0
+        if row is None:
+            return False, None
+        return True, row[1]
+
+    @classmethod
+    def insert_with_next_position(cls, wishlist_id: int, product_id: int, description=None):
+        """Insert a WishlistItem at the end of a wishlist in one statement
+
+        Computes the next position (MAX + 1000) inline and relies on the
+        composite primary key for conflict detection, so the whole
+        check-compute-insert sequence is a single round trip.
+
+        Returns the assigned position, or None if the product already
+        exists in the wishlist.
+        """
+        logger.info(
+            "Inserting product %s into wishlist %s", product_id, wishlist_id
+        )
+        stmt = db.text(
+            "INSERT INTO wishlist_items (wishlist_id, product_id, description, position) "
+            "SELECT CAST(:wishlist_id AS INTEGER), CAST(:product_id AS INTEGER), "
+            "CAST(:description AS VARCHAR), COALESCE(MAX(position), 0) + 1000 "
+            "FROM wishlist_items WHERE wishlist_id = :wishlist_id "
+            "ON CONFLICT (wishlist_id, product_id) DO NOTHING "
+            "RETURNING position"
+        )
+        try:
+            result = db.session.execute(
+                stmt,
+                {
+                    "wishlist_id": wishlist_id,
+                    "product_id": product_id,
+                    "description": description,
+                },
+            )
+            position = result.scalar()
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(
+                "Error inserting product %s into wishlist %s", product_id, wishlist_id
+            )
+            raise DataValidationError(e) from e
+        return position
+
+    @classmethod
+    def find_last_position(cls, wishlist_id: int):
+        """Find the last position number in a given wishlist
+
+        Uses a scalar MAX aggregate so the database returns a single
+        integer instead of hydrating a full row, and COALESCE returns 0
+        directly for an empty wishlist.
+        """
+        stmt = lambda_stmt(
+            lambda: select(db.func.coalesce(db.func.max(cls.position), 0)).where(
+                cls.wishlist_id == bindparam("wishlist_id")
+            )
+        )
+        return db.session.execute(stmt, {"wishlist_id": wishlist_id}).scalar()
+
+    @classmethod
+    def update_fields(cls, wishlist_id: int, product_id: int, **fields):
+        """Update a WishlistItem with a single UPDATE ... WHERE statement
+
+        Bypasses the unit of work entirely: no row is loaded and no
+        attribute history is tracked. Returns the item's position via
+        RETURNING, or None if no row matched the composite key.
+        """
+        logger.info("Updating product %s in wishlist %s", product_id, wishlist_id)
+        stmt = (
+            db.update(cls)
+            .where(cls.wishlist_id == wishlist_id, cls.product_id == product_id)
+            .values(**fields)
+            .returning(cls.position)
+        )
+        try:
+            position = db.session.execute(stmt).scalar()
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(
+                "Error updating product %s in wishlist %s", product_id, wishlist_id
+            )
+            raise DataValidationError(e) from e
+        return position
 
     def update(self) -> None:
         """
@@ -20,6 +20,7 @@ Model class for Wishlists
 
 import logging
 from datetime import date
+from sqlalchemy.orm import selectinload
 from .persistent_base import db, PersistentBase, DataValidationError
 from .wishlist_items import WishlistItems
 
@@ -44,7 +45,10 @@ class Wishlists(db.Model, PersistentBase):
         backref="wishlists",
         cascade="all, delete-orphan",
         passive_deletes=True,
-        lazy=True,
+        # selectin batches the items for every loaded wishlist into one
+        # WHERE wishlist_id IN (...) query instead of a lazy load per
+        # wishlist, without the join blowup of joined/subquery loading
+        lazy="selectin",
         order_by="WishlistItems.position",
     )
 
@@ -98,11 +102,88 @@ class Wishlists(db.Model, PersistentBase):
         """Find a Wishlist by its ID"""
         return db.session.get(cls, wishlist_id)
 
+    @classmethod
+    def find_with_items(cls, wishlist_id: int):
+        """Find a Wishlist by its ID, eagerly loading its items
+
+        Uses `selectinload` so the wishlist and all of its items are
+        fetched in a single round trip pair (`WHERE id = ?` followed by
+        `WHERE wishlist_id IN (?)`) instead of a lazy load per access.
+        """
+        return (
+            db.session.query(cls)
+            .options(selectinload(cls.wishlist_items))
+            .filter(cls.id == wishlist_id)
+            .first()
+        )
+
+    @classmethod
+    def get_customer_id(cls, wishlist_id: int):
+        """Fetch only the customer_id of a Wishlist
+
+        Authorization checks only need the owner, so this selects the
+        single column instead of hydrating the full row. Returns None
+        if the wishlist does not exist.
+        """
+        return db.session.query(cls.customer_id).filter_by(id=wishlist_id).scalar()
+
+    @classmethod
+    def update_fields(cls, wishlist_id: int, **fields):
+        """Update a Wishlist with a single UPDATE ... WHERE statement
+
+        Bypasses the unit of work: no row is loaded and no attribute
+        history is tracked, and the column-level onupdate still stamps
+        updated_date. Returns the updated row via RETURNING, or None if
+        no wishlist matched.
+        """
+        logger.info("Updating wishlist with id %s", wishlist_id)
+        stmt = (
+            db.update(cls)
+            .where(cls.id == wishlist_id)
+            .values(**fields)
+            .returning(
+                cls.id,
+                cls.customer_id,
+                cls.name,
+                cls.description,
+                cls.category,
+                cls.created_date,
+                cls.updated_date,
+            )
+        )
+        try:
+            row = db.session.execute(stmt).first()
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Error updating wishlist with id %s", wishlist_id)
+            raise DataValidationError(e) from e
+        return row
+
     @classmethod
     def find_all_by_customer_id(cls, customer_id: int):
         """Find all Wishlists for a given customer ID"""
         return cls.query.filter(cls.customer_id == customer_id).all()
 
+    @classmethod
+    def delete_by_id(cls, wishlist_id: int) -> int:
+        """Delete a Wishlist by its ID without loading it first
+
+        Issues a single DELETE and lets the database cascade to
+        wishlist_items via ON DELETE CASCADE, so no ORM instances are
+        hydrated. Returns the number of rows deleted (0 if the wishlist
+        did not exist).
+        """
+        logger.info("Deleting wishlist with id %s", wishlist_id)
+        try:
+            result = db.session.execute(db.delete(cls).where(cls.id == wishlist_id))
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Error deleting wishlist with id %s", wishlist_id)
+            raise DataValidationError(e) from e
+        return result.rowcount
+
     @classmethod
     def find_all_by_customer_id_and_name_like(cls, customer_id: int, name: str):
         """Find all Wishlists for a given customer where the name contains the given substring (case-insensitive)."""
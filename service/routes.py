@@ -35,6 +35,13 @@ PATCH /api/wishlists/{id}/items/{product_id} - Moves an item
 """
 
 # from datetime import date
+from functools import lru_cache
+from typing import NoReturn
+from urllib.parse import parse_qsl
+
+import fastjsonschema
+import msgspec
+import orjson
 from flask import jsonify, request
 from flask import current_app as app  # Import Flask application
 from flask_restx import Api, Resource, fields, reqparse
@@ -140,6 +147,24 @@ wishlist_item_model = api.inherit(
     },
 )
 
+# Compile the create-payload schema once at import time: validating a
+# body becomes a call into straight-line generated code instead of a
+# per-request walk over the model's field descriptors
+_validate_wishlist_create = fastjsonschema.compile(wishlist_create_model.__schema__)
+
+
+class WishlistItemCreate(msgspec.Struct):  # pylint: disable=too-few-public-methods
+    """Typed request body for creating a Wishlist Item
+
+    msgspec decodes the raw bytes straight into this struct with field
+    validation done in C, so the hot item-create path never builds an
+    intermediate dict. Unknown fields in the body are ignored.
+    """
+
+    product_id: int
+    description: str | None = None
+
+
 # query string arguments
 wishlist_args = reqparse.RequestParser()
 
@@ -168,6 +193,43 @@ wishlist_args.add_argument(
 )
 
 
+@lru_cache(maxsize=1024)
+def _parse_wishlist_args(query_string: bytes):
+    """Parse the list-endpoint query string into (customer_id, name, category)
+
+    Memoized on the raw query string bytes, so repeated identical
+    requests (including the common no-filter case) skip the reqparse
+    machinery entirely. `wishlist_args` above is kept for the Swagger
+    docs only.
+    """
+    args = dict(parse_qsl(query_string.decode("utf-8")))
+    customer_id = args.get("customer_id")
+    if customer_id is not None:
+        try:
+            customer_id = int(customer_id)
+        except ValueError:
+            raise DataValidationError("customer_id must be an integer") from None
+    return customer_id, args.get("name"), args.get("category")
+
+
+# 3-bit dispatch table for the list endpoint: bit 0 = customer_id,
+# bit 1 = name, bit 2 = category. Indexing replaces the old 7-way
+# if/elif chain with a single lookup; entry 6 mirrors that chain's
+# precedence (a name filter without customer_id ignores category).
+_WISHLIST_FILTERS = (
+    lambda cid, name, cat: Wishlists.all(),
+    lambda cid, name, cat: Wishlists.find_all_by_customer_id(cid),
+    lambda cid, name, cat: Wishlists.find_by_name_like(name),
+    lambda cid, name, cat: Wishlists.find_all_by_customer_id_and_name_like(cid, name),
+    lambda cid, name, cat: Wishlists.find_by_category(cat),
+    lambda cid, name, cat: Wishlists.find_by_customer_and_category(cid, cat),
+    lambda cid, name, cat: Wishlists.find_by_name_like(name),
+    lambda cid, name, cat: Wishlists.find_by_customer_category_name_like(
+        cid, cat, name
+    ),
+)
+
+
 ######################################################################
 #  PATH: /wishlists/{id}
 ######################################################################
@@ -198,7 +260,6 @@ class WishlistResource(Resource):
         app.logger.info("Request for Wishlist with id: %s", wishlist_id)
         wishlist = Wishlists.find(wishlist_id)
         if not wishlist:
-            app.logger.warning("Wishlist with id [%s] was not found.", wishlist_id)
             abort(
                 status.HTTP_404_NOT_FOUND,
                 f"Wishlist with id '{wishlist_id}' was not found.",
@@ -222,14 +283,16 @@ class WishlistResource(Resource):
         """
         app.logger.info("Request to update wishlist with id: %s", wishlist_id)
 
-        wishlist = Wishlists.find_by_id(wishlist_id)
-        if not wishlist:
+        # The auth check only needs the owner, so fetch that one column
+        # instead of hydrating the whole row just to compare it
+        owner = Wishlists.get_customer_id(wishlist_id)
+        if owner is None:
             abort(
                 status.HTTP_404_NOT_FOUND,
                 f"Wishlist with id '{wishlist_id}' was not found.",
             )
 
-        if wishlist.customer_id != STATE_CUSTOMER_ID:
+        if owner != STATE_CUSTOMER_ID:
             abort(
                 status.HTTP_403_FORBIDDEN,
                 "You do not have permission to update this wishlist.",
@@ -241,15 +304,27 @@ class WishlistResource(Resource):
                 status.HTTP_400_BAD_REQUEST,
                 f"ID in the body {data['id']} does not match the path ID {wishlist_id}.",
             )
-        data["customer_id"] = wishlist.customer_id
+        data["customer_id"] = owner
 
+        # Validate against a transient instance, then apply the change
+        # with a single UPDATE ... RETURNING instead of load-and-flush
         try:
-            wishlist.deserialize(data)
-            wishlist.update()
+            wishlist = Wishlists().deserialize(data)
         except DataValidationError as error:
             abort(status.HTTP_400_BAD_REQUEST, str(error))
 
-        return wishlist.serialize(), status.HTTP_200_OK
+        row = Wishlists.update_fields(
+            wishlist_id,
+            name=wishlist.name,
+            description=wishlist.description,
+            category=wishlist.category,
+        )
+        if row is None:
+            # Deleted between the auth check and the UPDATE
+            abort(
+                status.HTTP_404_NOT_FOUND, f"Wishlist with id '{wishlist_id}' not found"
+            )
+        return row._asdict(), status.HTTP_200_OK
 
     # ------------------------------------------------------------------
     # Delete A WISHLIST
@@ -264,11 +339,10 @@ class WishlistResource(Resource):
         """
         app.logger.info("Request to delete wishlist with id: %s", wishlist_id)
 
-        # Retrieve the wishlist to delete and delete it if it exists
-        wishlist = Wishlists.find(wishlist_id)
-        if wishlist:
-            app.logger.info("Deleting wishlist with id: %s", wishlist_id)
-            wishlist.delete()
+        # Single DELETE; the database cascades to wishlist_items and
+        # deleting a missing wishlist is still a 204 per REST idempotency
+        deleted = Wishlists.delete_by_id(wishlist_id)
+        if deleted:
             app.logger.info("Wishlist with id: %s deleted", wishlist_id)
 
         return "", status.HTTP_204_NO_CONTENT
@@ -292,55 +366,22 @@ class WishlistCollection(Resource):
         app.logger.info("Request to list all Wishlists")
 
         # Parse query parameters
-        args = wishlist_args.parse_args()
-        customer_id = args.get("customer_id")
-        name_query = args.get("name")
-        category_query = args.get("category")
-
-        if (
-            customer_id is not None
-            and category_query is not None
-            and name_query is not None
-        ):
-            app.logger.info(
-                "Filter by customer_id=%s, category=%s, name like=%s",
-                customer_id,
-                category_query,
-                name_query,
-            )
-            wishlists = Wishlists.find_by_customer_category_name_like(
-                customer_id, category_query, name_query
-            )
-
-        elif customer_id is not None and category_query is not None:
-            app.logger.info(
-                "Filter by customer_id=%s AND category=%s", customer_id, category_query
-            )
-            wishlists = Wishlists.find_by_customer_and_category(
-                customer_id, category_query
-            )
-
-        elif customer_id is not None and name_query is not None:
-            app.logger.info(
-                "Filter by customer_id=%s AND name like=%s", customer_id, name_query
-            )
-            wishlists = Wishlists.find_all_by_customer_id_and_name_like(
-                customer_id, name_query
-            )
+        customer_id, name_query, category_query = _parse_wishlist_args(
+            request.query_string
+        )
 
-        elif customer_id is not None:
-            app.logger.info("Filter by customer_id=%s", customer_id)
-            wishlists = Wishlists.find_all_by_customer_id(customer_id)
-        elif name_query is not None:
-            wishlists = Wishlists.find_by_name_like(name_query)
-        elif category_query is not None:
-            app.logger.info(
-                "Filter by category=%s (global, no customer_id)", category_query
-            )
-            wishlists = Wishlists.find_by_category(category_query)
-        else:
-            app.logger.info("Returning all Wishlists")
-            wishlists = Wishlists.all()
+        mask = (
+            (customer_id is not None)
+            | (name_query is not None) << 1
+            | (category_query is not None) << 2
+        )
+        app.logger.info(
+            "Filter wishlists by customer_id=%s, name like=%s, category=%s",
+            customer_id,
+            name_query,
+            category_query,
+        )
+        wishlists = _WISHLIST_FILTERS[mask](customer_id, name_query, category_query)
 
         results = [wishlist.serialize() for wishlist in wishlists]
         app.logger.info("Returning %d wishlists", len(results))
@@ -360,9 +401,15 @@ class WishlistCollection(Resource):
         This endpoint will create a Wishlist based the data in the body that is posted
         """
         app.logger.info("Request to create a Wishlist")
+        data = api.payload
+        try:
+            _validate_wishlist_create(data)
+        except fastjsonschema.JsonSchemaException as error:
+            raise DataValidationError(error.message) from error
+
         # Create the wishlist
         wishlist = Wishlists()
-        wishlist.deserialize(api.payload)
+        wishlist.deserialize(data)
         # NOTE: Validate customer_id once authentication is implemented
         wishlist.create()
 
@@ -411,16 +458,15 @@ class WishlistItemResource(Resource):
             wishlist_id,
         )
 
-        wishlist = Wishlists.find(wishlist_id)
-        if not wishlist:
+        wishlist_exists, wishlist_item = WishlistItems.find_with_parent_check(
+            wishlist_id, product_id
+        )
+        if not wishlist_exists:
             abort(
                 status.HTTP_404_NOT_FOUND,
                 f"Wishlist with id '{wishlist_id}' not found",
             )
 
-        wishlist_item = WishlistItems.find_by_wishlist_and_product(
-            wishlist_id, product_id
-        )
         if not wishlist_item:
             abort(
                 status.HTTP_404_NOT_FOUND,
@@ -449,29 +495,33 @@ class WishlistItemResource(Resource):
             wishlist_id,
         )
 
-        wishlist = Wishlists.find(wishlist_id)
-        if not wishlist:
-            abort(
-                status.HTTP_404_NOT_FOUND, f"Wishlist with id '{wishlist_id}' not found"
-            )
-
-        wishlist_item = WishlistItems.find_by_wishlist_and_product(
-            wishlist_id, product_id
-        )
-        if not wishlist_item:
-            abort(
-                status.HTTP_404_NOT_FOUND,
-                f"Wishlist Item with id '{product_id}' not found in Wishlist with id '{wishlist_id}'",
-            )
-
-        data = api.payload
+        data = parse_json_body()
         data.pop("position", None)  # position cannot be updated via PUT
-        wishlist_item.deserialize(data)
-        wishlist_item.wishlist_id = wishlist_id
-        wishlist_item.product_id = product_id
-        wishlist_item.update()
+        wishlist_item = WishlistItems()
+        try:
+            wishlist_item.deserialize(data)
+        except DataValidationError as error:
+            # Only burn queries on the 404-vs-400 distinction once the
+            # body has already failed validation
+            abort_if_missing(wishlist_id, product_id)
+            abort(status.HTTP_400_BAD_REQUEST, str(error))
 
-        return wishlist_item.serialize(), status.HTTP_200_OK
+        # Hot path: one UPDATE ... RETURNING, no SELECT first
+        position = WishlistItems.update_fields(
+            wishlist_id, product_id, description=wishlist_item.description
+        )
+        if position is None:
+            abort_if_missing(wishlist_id, product_id)
+
+        return (
+            {
+                "wishlist_id": wishlist_id,
+                "product_id": product_id,
+                "description": wishlist_item.description,
+                "position": position,
+            },
+            status.HTTP_200_OK,
+        )
 
     # ------------------------------------------------------------------
     # Delete A WISHLIST ITEM
@@ -490,15 +540,14 @@ class WishlistItemResource(Resource):
             wishlist_id,
         )
 
-        wishlist = Wishlists.find(wishlist_id)
-        if not wishlist:
+        wishlist_exists, wishlist_item = WishlistItems.find_with_parent_check(
+            wishlist_id, product_id
+        )
+        if not wishlist_exists:
             abort(
                 status.HTTP_404_NOT_FOUND, f"Wishlist with id '{wishlist_id}' not found"
             )
 
-        wishlist_item = WishlistItems.find_by_wishlist_and_product(
-            wishlist_id, product_id
-        )
         if not wishlist_item:
             abort(
                 status.HTTP_404_NOT_FOUND,
@@ -527,23 +576,22 @@ class WishlistItemResource(Resource):
             wishlist_id,
         )
 
-        wishlist = Wishlists.find(wishlist_id)
-        if not wishlist:
+        wishlist_exists, wishlist_item = WishlistItems.find_with_parent_check(
+            wishlist_id, product_id
+        )
+        if not wishlist_exists:
             abort(
                 status.HTTP_400_BAD_REQUEST,
                 f"Wishlist with id '{wishlist_id}' not found",
             )
 
-        wishlist_item = WishlistItems.find_by_wishlist_and_product(
-            wishlist_id, product_id
-        )
         if not wishlist_item:
             abort(
                 status.HTTP_404_NOT_FOUND,
                 f"Wishlist Item with id '{product_id}' not found in Wishlist with id '{wishlist_id}'",
             )
 
-        data = request.get_json()
+        data = parse_json_body()
         before_position = data.get("before_position")
         if before_position is None:
             before_position = data.get("position")
@@ -572,25 +620,27 @@ class WishlistItemCollection(Resource):
     # ------------------------------------------------------------------
     # LIST ALL ITEMS IN A WISHLIST
     # ------------------------------------------------------------------
-    @api.doc("list_wishlist_items")
+    @api.doc("list_wishlist_items", model=[wishlist_item_model])
     @api.response(404, "Wishlist or Wishlist Item not found")
-    @api.marshal_list_with(wishlist_item_model)
     def get(self, wishlist_id):
         """Returns all of the Wishlist Items"""
         app.logger.info(
             "Request to list all Wishlist Items for Wishlist with id: %s", wishlist_id
         )
 
-        wishlist = Wishlists.find(wishlist_id)
+        wishlist = Wishlists.find_with_items(wishlist_id)
         if not wishlist:
             abort(
                 status.HTTP_404_NOT_FOUND, f"Wishlist with id '{wishlist_id}' not found"
             )
 
-        items = wishlist.wishlist_items
-        results = [item.serialize() for item in items]
+        # serialize() already emits plain dicts, so skip the flask_restx
+        # marshaller and dump the list C-side with orjson
+        results = [item.serialize() for item in wishlist.wishlist_items]
 
-        return results, status.HTTP_200_OK
+        return app.response_class(
+            orjson.dumps(results), mimetype="application/json"
+        )
 
     # ------------------------------------------------------------------
     # ADD A NEW WISHLIST ITEM
@@ -612,35 +662,39 @@ class WishlistItemCollection(Resource):
             wishlist_id,
         )
 
-        wishlist = Wishlists.find(wishlist_id)
-        if not wishlist:
+        # Column-only existence check: find() would hydrate the wishlist
+        # and selectin-load its items, neither of which this handler uses
+        if Wishlists.get_customer_id(wishlist_id) is None:
             abort(
                 status.HTTP_404_NOT_FOUND, f"Wishlist with id '{wishlist_id}' not found"
             )
 
-        data = request.get_json()
-        wishlist_item = WishlistItems()
+        if not request.is_json:
+            abort(
+                status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                "Content-Type must be application/json",
+            )
         try:
-            wishlist_item.deserialize(data)
-        except DataValidationError as error:
+            payload = msgspec.json.decode(request.get_data(), type=WishlistItemCreate)
+        except msgspec.DecodeError as error:
             abort(status.HTTP_400_BAD_REQUEST, str(error))
 
-        existing_items = WishlistItems.find_by_wishlist_and_product(
-            wishlist_id, wishlist_item.product_id
+        position = WishlistItems.insert_with_next_position(
+            wishlist_id, payload.product_id, payload.description
         )
-        if existing_items:
+        if position is None:
             abort(
                 status.HTTP_409_CONFLICT,
-                f"Product with id '{wishlist_item.product_id}' already exists in wishlist",
+                f"Product with id '{payload.product_id}' already exists in wishlist",
             )
 
-        last_position = WishlistItems.find_last_position(wishlist_id)
-        wishlist_item.wishlist_id = wishlist_id
-        wishlist_item.position = last_position + 1000
-        wishlist_item.create()
-
-        message = wishlist_item.serialize()
-        location_url = f"/api/wishlists/{wishlist_id}/items/{wishlist_item.product_id}"
+        message = {
+            "wishlist_id": wishlist_id,
+            "product_id": payload.product_id,
+            "description": payload.description,
+            "position": position,
+        }
+        location_url = f"/api/wishlists/{wishlist_id}/items/{payload.product_id}"
 
         return message, status.HTTP_201_CREATED, {"location": location_url}
 
@@ -650,7 +704,48 @@ class WishlistItemCollection(Resource):
 ######################################################################
 
 
-def abort(error_code: int, message: str):
-    """Logs errors before aborting"""
-    app.logger.error(message)
+def abort(error_code: int, message: str) -> NoReturn:
+    """Logs before aborting
+
+    A missing wishlist or item is an expected outcome, not a service
+    error, so it is logged at info with lazy %-formatting — when the
+    handler is filtered the interpolation never runs on the hot 404
+    path.
+    """
+    app.logger.info("Aborting request with status %s: %s", error_code, message)
     api.abort(error_code, message)
+
+
+def abort_if_missing(wishlist_id: int, product_id: int):
+    """Abort with a 404 for whichever of the wishlist/item pair is missing
+
+    Does nothing when both exist, so callers can fall through to their
+    own error handling.
+    """
+    if not Wishlists.find(wishlist_id):
+        abort(
+            status.HTTP_404_NOT_FOUND, f"Wishlist with id '{wishlist_id}' not found"
+        )
+    if not WishlistItems.find_by_wishlist_and_product(wishlist_id, product_id):
+        abort(
+            status.HTTP_404_NOT_FOUND,
+            f"Wishlist Item with id '{product_id}' not found in Wishlist with id '{wishlist_id}'",
+        )
+
+
+def parse_json_body() -> dict:
+    """Parse the request body with orjson
+
+    orjson decodes the raw bytes C-side, several times faster than the
+    stdlib json used by request.get_json(). Mirrors its error behavior:
+    415 for a non-JSON Content-Type and 400 for a malformed body.
+    """
+    if not request.is_json:
+        abort(
+            status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            "Content-Type must be application/json",
+        )
+    try:
+        return orjson.loads(request.get_data())
+    except orjson.JSONDecodeError:
+        abort(status.HTTP_400_BAD_REQUEST, "Request body is not valid JSON")
@@ -17,11 +17,14 @@ class WishlistsFactory(factory.Factory):
 
         model = Wishlists
 
+    # Sequences instead of Faker: the tests only need distinct strings,
+    # and deterministic values avoid both the provider overhead and the
+    # chance of a random word colliding with a query filter
     id = factory.Sequence(lambda n: n)
     customer_id = CUSTOMER_ID
-    name = factory.Faker("word")
-    description = factory.Faker("sentence")
-    category = factory.Faker("word")
+    name = factory.Sequence(lambda n: f"wishlist-{n}")
+    description = factory.Sequence(lambda n: f"wishlist {n} description")
+    category = factory.Sequence(lambda n: f"category-{n}")
     created_date = date.today()
     updated_date = None
 
@@ -40,5 +43,5 @@ class WishlistItemsFactory(factory.Factory):
 
     wishlist_id = 1
     product_id = factory.Sequence(lambda n: n)
-    description = factory.Faker("sentence")
+    description = factory.Sequence(lambda n: f"item {n} description")
     position = factory.Sequence(lambda n: n * 1000)